@@ -10,7 +10,7 @@ from typing import TYPE_CHECKING
 
 from artifice.agent.conversation import ConversationManager
 from artifice.agent.providers.base import Provider, TokenUsage
-from artifice.agent.tools.base import ToolCall, get_schemas_for
+from artifice.agent.tools.base import TOOLS, ToolCall, get_schemas_for
 
 if TYPE_CHECKING:
     from collections.abc import Callable
@@ -53,6 +53,27 @@ class Agent(ConversationManager):
         self._on_connect = on_connect
         self._connected = False
         self._provider = provider
+        self._tool_schemas: list[dict] | None = None
+        self._tool_schemas_key: tuple | None = None
+
+    def _get_tool_schemas(self) -> list[dict] | None:
+        """Return schemas for ``self.tools``, rebuilt only when the tools change."""
+        if not self.tools:
+            return None
+        # Registered tools are compared by identity: re-registering a name
+        # replaces its ToolDef without changing the size of TOOLS
+        tools = tuple(self.tools)
+        registered = tuple(TOOLS.values())
+        cached = self._tool_schemas_key
+        if (
+            cached is None
+            or cached[0] != tools
+            or len(cached[1]) != len(registered)
+            or any(old is not new for old, new in zip(cached[1], registered))
+        ):
+            self._tool_schemas_key = (tools, registered)
+            self._tool_schemas = get_schemas_for(self.tools)
+        return self._tool_schemas
 
     async def send(
         self,
@@ -75,13 +96,16 @@ class Agent(ConversationManager):
         if sys_content and (not messages or messages[0].get("role") != "system"):
             messages = [{"role": "system", "content": sys_content}, *messages]
 
-        tool_schemas = get_schemas_for(self.tools) if self.tools else None
+        tool_schemas = self._get_tool_schemas()
 
         try:
-            text = ""
-            thinking = ""
+            # Accumulate fragments in lists and join once the stream ends;
+            # tool call arguments in particular can arrive as many tiny deltas.
+            text_parts: list[str] = []
+            thinking_parts: list[str] = []
             usage: TokenUsage | None = None
             raw_tool_calls: list[dict] = []
+            argument_parts: list[list[str]] = []
 
             async for chunk in self._provider.stream_completion(
                 messages=messages,
@@ -92,9 +116,9 @@ class Agent(ConversationManager):
                 if chunk.usage:
                     usage = chunk.usage
                 if chunk.content:
-                    text += chunk.content
+                    text_parts.append(chunk.content)
                 if chunk.reasoning:
-                    thinking += chunk.reasoning
+                    thinking_parts.append(chunk.reasoning)
                 if chunk.tool_calls:
                     for tc in chunk.tool_calls:
                         idx = tc["index"]
@@ -106,13 +130,19 @@ class Agent(ConversationManager):
                                     "function": {"name": "", "arguments": ""},
                                 }
                             )
+                            argument_parts.append([])
                         rtc = raw_tool_calls[idx]
                         if tc["id"]:
                             rtc["id"] += tc["id"]
                         if tc["function"]["name"]:
                             rtc["function"]["name"] += tc["function"]["name"]
                         if tc["function"]["arguments"]:
-                            rtc["function"]["arguments"] += tc["function"]["arguments"]
+                            argument_parts[idx].append(tc["function"]["arguments"])
+
+            text = "".join(text_parts)
+            thinking = "".join(thinking_parts)
+            for rtc, parts in zip(raw_tool_calls, argument_parts):
+                rtc["function"]["arguments"] = "".join(parts)
 
         except asyncio.CancelledError:
             if prompt.strip():
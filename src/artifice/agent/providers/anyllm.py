@@ -83,11 +83,12 @@ class AnyLLMProvider(Provider):
             stream_chunk = StreamChunk()
 
             # Extract usage if available
-            if hasattr(chunk, "usage") and chunk.usage:
+            usage = getattr(chunk, "usage", None)
+            if usage:
                 stream_chunk.usage = TokenUsage(
-                    input_tokens=chunk.usage.prompt_tokens or 0,
-                    output_tokens=chunk.usage.completion_tokens or 0,
-                    total_tokens=chunk.usage.total_tokens or 0,
+                    input_tokens=usage.prompt_tokens or 0,
+                    output_tokens=usage.completion_tokens or 0,
+                    total_tokens=usage.total_tokens or 0,
                 )
 
             if not chunk.choices:
@@ -97,11 +98,12 @@ class AnyLLMProvider(Provider):
             delta = chunk.choices[0].delta
 
             # Extract reasoning/thinking content
-            if hasattr(delta, "reasoning") and delta.reasoning:
+            reasoning = getattr(delta, "reasoning", None)
+            if reasoning:
                 reasoning_content = (
-                    delta.reasoning.content
-                    if hasattr(delta.reasoning, "content")
-                    else str(delta.reasoning)
+                    reasoning.content
+                    if hasattr(reasoning, "content")
+                    else str(reasoning)
                 )
                 stream_chunk.reasoning = reasoning_content
                 if on_thinking_chunk:
@@ -114,7 +116,8 @@ class AnyLLMProvider(Provider):
                     on_chunk(delta.content)
 
             # Extract tool calls
-            if hasattr(delta, "tool_calls") and delta.tool_calls:
+            tool_calls = getattr(delta, "tool_calls", None)
+            if tool_calls:
                 stream_chunk.tool_calls = [
                     {
                         "index": tc.index,
@@ -124,7 +127,7 @@ class AnyLLMProvider(Provider):
                             "arguments": tc.function.arguments if tc.function else "",
                         },
                     }
-                    for tc in delta.tool_calls
+                    for tc in tool_calls
                 ]
                 logger.debug(
                     "Extracted tool calls from chunk: %s", stream_chunk.tool_calls
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import asyncio
+import itertools
 import re
 import logging
 from typing import Any, Callable
@@ -464,6 +465,7 @@ def _build_tool_tag_re() -> re.Pattern:
 
 
 _TOOL_TAG_RE = _build_tool_tag_re()
+_EXTRA_BLANK_LINES_RE = re.compile(r"\n{3,}")
 
 
 async def _stream_text(
@@ -553,7 +555,7 @@ def _parse_tool_calls(text: str, start_id: int = 0) -> tuple[str, list[ToolCall]
         return ""
 
     prose = _TOOL_TAG_RE.sub(replace, text)
-    prose = re.sub(r"\n{3,}", "\n\n", prose).strip()
+    prose = _EXTRA_BLANK_LINES_RE.sub("\n\n", prose).strip()
     return prose, tool_calls
 
 
@@ -581,22 +583,41 @@ class SimulatedAgent(ConversationManager):
         self.response_delay = response_delay
         self._tc_counter = 0
 
-        self.scenarios: list[dict[str, Any]] = list(_DEFAULT_SCENARIOS)
+        self.scenarios: list[dict[str, Any]] = []
+        # Compiled scenario patterns, keyed by the pattern string
+        self._compiled: dict[str, re.Pattern] = {}
+        self._set_scenarios(_DEFAULT_SCENARIOS)
         self.current_scenario_index = 0
         self.default_response = _DEFAULT_RESPONSE
         self.default_thinking: str | None = _DEFAULT_THINKING
 
     def configure_defaults(self):
         """Reset to default scenarios and responses."""
-        self.scenarios = list(_DEFAULT_SCENARIOS)
+        self._set_scenarios(_DEFAULT_SCENARIOS)
         self.default_response = _DEFAULT_RESPONSE
         self.default_thinking = _DEFAULT_THINKING
 
     def configure_scenarios(self, scenarios: list[dict[str, Any]]) -> None:
         """Replace scenarios with a custom list."""
-        self.scenarios = list(scenarios)
+        self._set_scenarios(scenarios)
         self.current_scenario_index = 0
 
+    def _set_scenarios(self, scenarios: list[dict[str, Any]]) -> None:
+        """Store scenarios and compile their patterns."""
+        self.scenarios = list(scenarios)
+        self._compiled = {}
+        for scenario in self.scenarios:
+            pattern = scenario.get("pattern")
+            if pattern:
+                self._compile(pattern)
+
+    def _compile(self, pattern: str) -> re.Pattern:
+        """Return the compiled form of a scenario pattern, compiling on first use."""
+        compiled = self._compiled.get(pattern)
+        if compiled is None:
+            compiled = self._compiled[pattern] = re.compile(pattern, re.IGNORECASE)
+        return compiled
+
     def set_default_response(self, response: str) -> None:
         """Set the default response for unmatched prompts."""
         self.default_response = response
@@ -614,17 +635,19 @@ class SimulatedAgent(ConversationManager):
             scenario["pattern"] = pattern
         if thinking is not None:
             scenario["thinking"] = thinking
+        if pattern:
+            self._compile(pattern)
         self.scenarios.append(scenario)
 
     def _find_scenario(self, prompt: str) -> dict[str, Any] | None:
         for s in self.scenarios:
             pattern = s.get("pattern")
-            if pattern and re.search(pattern, prompt, re.IGNORECASE):
+            if pattern and self._compile(pattern).search(prompt):
                 logger.debug("Matched scenario with pattern: %s", pattern)
                 return s
-        sequential = [s for s in self.scenarios if not s.get("pattern")]
-        if self.current_scenario_index < len(sequential):
-            s = sequential[self.current_scenario_index]
+        sequential = (s for s in self.scenarios if not s.get("pattern"))
+        s = next(itertools.islice(sequential, self.current_scenario_index, None), None)
+        if s is not None:
             self.current_scenario_index += 1
             logger.debug("Using sequential scenario %d", self.current_scenario_index)
             return s
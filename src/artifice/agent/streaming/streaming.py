@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import asyncio
 import inspect
+import io
 import logging
 import re
 import time
@@ -21,7 +22,7 @@ if TYPE_CHECKING:
 logger = logging.getLogger(__name__)
 
 
-HEADER_PATTERN = re.compile(r"^(#{1,6})(\s|$)")
+HEADER_PATTERN = re.compile(r"^(#{1,6})(\s|$)", re.MULTILINE)
 
 
 class ChunkBuffer:
@@ -35,35 +36,60 @@ class ChunkBuffer:
                   (e.g. ``widget.call_later``).
         drain: Callable(text) invoked with the accumulated text when flushed.
         min_interval: Minimum seconds between drain operations (default: 1/60 for 60 FPS).
+        ready: Optional Callable(text) -> bool. When given, appending text for
+               which it returns False buffers without scheduling a drain, since
+               the consumer could not make progress on it yet.
     """
 
+    __slots__ = (
+        "_buffer",
+        "_drain",
+        "_last_drain_time",
+        "_min_interval",
+        "_paused",
+        "_ready",
+        "_schedule",
+        "_scheduled",
+        "_tasks",
+        "_timer",
+    )
+
     def __init__(
-        self, schedule: Callable, drain: Callable, min_interval: float = 1.0 / 60.0
+        self,
+        schedule: Callable,
+        drain: Callable,
+        min_interval: float = 1.0 / 60.0,
+        ready: Callable[[str], bool] | None = None,
     ) -> None:
         self._schedule = schedule
         self._drain = drain
-        self._buffer: str = ""
+        self._ready = ready
+        self._buffer = io.StringIO()
         self._scheduled: bool = False
+        self._timer: asyncio.TimerHandle | None = None
         self._min_interval = min_interval
         self._last_drain_time: float = 0.0
         self._paused: bool = False
+        # Drain coroutines spawned by _flush/flush_sync that have not finished
+        self._tasks: set[asyncio.Task] = set()
 
     def append(self, text: str) -> None:
         """Add *text* to the buffer and schedule a drain if needed."""
-        self._buffer += text
-        if not self._scheduled:
+        self._buffer.write(text)
+        if not self._scheduled and (self._ready is None or self._ready(text)):
             self._scheduled = True
             now = time.monotonic()
             elapsed = now - self._last_drain_time
             if elapsed >= self._min_interval:
                 self._schedule(self._flush)
-            else:
-                delay = self._min_interval - elapsed
-                self._schedule(lambda: self._schedule_delayed_flush(delay))
-
-    def _schedule_delayed_flush(self, delay: float) -> None:
-        """Schedule a flush after the specified delay."""
-        asyncio.get_running_loop().call_later(delay, self._flush)
+                return
+            try:
+                loop = asyncio.get_running_loop()
+            except RuntimeError:
+                # No loop to time the delay on; fall back to the next tick
+                self._schedule(self._flush)
+                return
+            self._timer = loop.call_later(self._min_interval - elapsed, self._flush)
 
     def pause(self) -> None:
         """Pause draining - buffer keeps accumulating but won't flush."""
@@ -72,36 +98,69 @@ class ChunkBuffer:
     def resume(self) -> None:
         """Resume draining - triggers a flush if buffer has content."""
         self._paused = False
-        if self._buffer:
+        if self.pending:
             self._flush()
 
     def _flush(self) -> None:
         self._scheduled = False
+        self._timer = None
         if self._paused:
             return
-        if self._buffer:
-            text = self._buffer
-            self._buffer = ""
-            self._last_drain_time = time.monotonic()
-            result = self._drain(text)
-            if inspect.iscoroutine(result):
-                asyncio.create_task(result)
+        if self.pending:
+            self._drain_buffer()
 
     def flush_sync(self) -> None:
-        """Drain any remaining buffered text immediately."""
-        self._scheduled = False
-        if self._buffer:
-            text = self._buffer
-            self._buffer = ""
-            self._last_drain_time = time.monotonic()
-            result = self._drain(text)
+        """Drain any remaining buffered text immediately.
+
+        An async ``drain`` is only spawned as a task; use ``flush_async`` when
+        the caller needs the text to have been processed on return.
+        """
+        self._cancel_scheduled()
+        if self.pending:
+            self._drain_buffer()
+
+    async def flush_async(self) -> None:
+        """Drain any remaining buffered text and wait until it is processed.
+
+        Waits for drains spawned earlier, then awaits the final drain directly
+        so every appended chunk has reached ``drain`` in order on return.
+        """
+        self._cancel_scheduled()
+        # Loop: an already-queued _flush may spawn another drain while we wait
+        while self._tasks:
+            await asyncio.gather(*self._tasks)
+        if self.pending:
+            result = self._drain(self._take())
             if inspect.iscoroutine(result):
-                asyncio.create_task(result)
+                await result
+
+    def _cancel_scheduled(self) -> None:
+        """Forget any scheduled drain and cancel its timer, if armed."""
+        self._scheduled = False
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+    def _take(self) -> str:
+        """Return the buffered text and rewind the buffer for reuse."""
+        text = self._buffer.getvalue()
+        self._buffer.seek(0)
+        self._buffer.truncate()
+        self._last_drain_time = time.monotonic()
+        return text
+
+    def _drain_buffer(self) -> None:
+        """Hand the buffered text to ``drain``, spawning it if it is async."""
+        result = self._drain(self._take())
+        if inspect.iscoroutine(result):
+            task = asyncio.create_task(result)
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
 
     @property
     def pending(self) -> bool:
         """True if the buffer has un-drained text."""
-        return bool(self._buffer)
+        return self._buffer.tell() > 0
 
 
 class StreamingFenceDetector:
@@ -112,6 +171,17 @@ class StreamingFenceDetector:
     and the previous block is finalized.
     """
 
+    __slots__ = (
+        "_block_factory",
+        "_block_has_content",
+        "_current_block",
+        "_incomplete_line",
+        "_output",
+        "_started",
+        "all_blocks",
+        "first_agent_block",
+    )
+
     def __init__(
         self, output: TerminalOutput, block_factory: Any | None = None
     ) -> None:
@@ -120,11 +190,9 @@ class StreamingFenceDetector:
         self.first_agent_block: AgentOutputBlock | None = None
         self._started = False
         self._current_block: AgentOutputBlock | None = None
-        self._incomplete_line: str = ""
+        self._incomplete_line: list[str] = []
         self._block_has_content: bool = False
-        self._make_prose_block = block_factory or (
-            lambda activity: AgentOutputBlock(activity=activity)
-        )
+        self._block_factory = block_factory
 
     def start(self) -> None:
         """Create the initial AgentOutputBlock for streaming.
@@ -140,11 +208,23 @@ class StreamingFenceDetector:
 
     def _create_and_mount_prose(self, activity: bool = True) -> AgentOutputBlock:
         """Create a prose block using the factory or test override."""
-        block = self._make_prose_block(activity)
+        if self._block_factory is None:
+            block = AgentOutputBlock(activity=activity)
+        else:
+            block = self._block_factory(activity)
         self._output.append_block(block, scroll=False)
         self.all_blocks.append(block)
         return block
 
+    def can_advance(self, text: str) -> bool:
+        """Return True if feeding *text* would produce visible output.
+
+        Until started, any text is worth draining so the first block mounts
+        promptly. After that, only complete lines are appended, so text without
+        a newline is just held in the incomplete line.
+        """
+        return not self._started or "\n" in text
+
     def _is_header_line(self, line: str) -> bool:
         """Check if a line is a markdown header.
 
@@ -155,53 +235,70 @@ class StreamingFenceDetector:
             return False
         return HEADER_PATTERN.match(line) is not None
 
-    async def feed(self, text: str) -> None:
+    async def feed(self, text: str) -> bool:
         """Process a chunk of streaming text, splitting on headers.
 
         Text is accumulated line by line. When a line starting with a markdown
         header is encountered (and the current block has content), a new block
         is created and the header starts that new block.
-        """
-        if not text or self._current_block is None:
-            return
 
-        i = 0
-        while i < len(text):
-            newline_pos = text.find("\n", i)
+        All complete lines in the chunk are scanned at once with
+        ``HEADER_PATTERN``; the text between headers is appended in a single
+        call rather than line by line.
 
-            if newline_pos == -1:
-                self._incomplete_line += text[i:]
-                break
+        Returns True if any text was appended to a block.
+        """
+        if not text or self._current_block is None:
+            return False
 
-            line = self._incomplete_line + text[i:newline_pos]
-            self._incomplete_line = ""
+        last_newline = text.rfind("\n")
+        if last_newline == -1:
+            self._incomplete_line.append(text)
+            return False
 
-            if self._is_header_line(line) and self._block_has_content:
+        if self._incomplete_line:
+            self._incomplete_line.append(text[: last_newline + 1])
+            lines = "".join(self._incomplete_line)
+            self._incomplete_line.clear()
+        else:
+            lines = text[: last_newline + 1]
+        if last_newline + 1 < len(text):
+            self._incomplete_line.append(text[last_newline + 1 :])
+
+        start = 0
+        for match in HEADER_PATTERN.finditer(lines):
+            header_pos = match.start()
+            if header_pos > start:
+                await self._current_block.append(lines[start:header_pos])
+                self._block_has_content = True
+                start = header_pos
+            if self._block_has_content:
                 self._current_block.finalize_streaming()
                 self._current_block.mark_success()
 
                 self._current_block = self._create_and_mount_prose(activity=True)
                 self._block_has_content = False
 
-            line_with_newline = line + "\n"
-            await self._current_block.append(line_with_newline)
+        if start < len(lines):
+            await self._current_block.append(lines[start:])
             self._block_has_content = True
-
-            i = newline_pos + 1
+        return True
 
     async def finish(self) -> None:
         """Flush any remaining state at end of stream."""
         self.start()
 
-        if self._incomplete_line and self._current_block is not None:
-            if self._is_header_line(self._incomplete_line) and self._block_has_content:
+        remainder = "".join(self._incomplete_line)
+        self._incomplete_line.clear()
+        if remainder and self._current_block is not None:
+            if self._is_header_line(remainder) and self._block_has_content:
                 self._current_block.finalize_streaming()
                 self._current_block.mark_success()
                 self._current_block = self._create_and_mount_prose(activity=True)
                 self._block_has_content = False
 
             if self._current_block is not None:
-                await self._current_block.append(self._incomplete_line)
+                await self._current_block.append(remainder)
                 self._block_has_content = True
 
         if self._current_block is not None:
@@ -217,6 +314,17 @@ class StreamManager:
     terminal via callbacks.
     """
 
+    __slots__ = (
+        "_batch_update",
+        "_call_after_refresh",
+        "_chunk_buf",
+        "_current_detector",
+        "_output",
+        "_scroll_scheduled",
+        "_thinking_block",
+        "_thinking_buf",
+    )
+
     def __init__(
         self,
         output: TerminalOutput,
@@ -232,7 +340,9 @@ class StreamManager:
         self._current_detector: StreamingFenceDetector | None = None
         self._thinking_block: ThinkingOutputBlock | None = None
         min_interval = 1.0 / streaming_fps
-        self._chunk_buf = ChunkBuffer(call_later, self._drain_chunks, min_interval)
+        self._chunk_buf = ChunkBuffer(
+            call_later, self._drain_chunks, min_interval, ready=self._chunk_ready
+        )
         self._thinking_buf = ChunkBuffer(call_later, self._drain_thinking, min_interval)
         self._scroll_scheduled = False
 
@@ -255,6 +365,11 @@ class StreamManager:
         if self._current_detector:
             self._chunk_buf.append(text)
 
+    def _chunk_ready(self, text: str) -> bool:
+        """Only drain chunks once the detector can make progress on them."""
+        detector = self._current_detector
+        return detector is not None and detector.can_advance(text)
+
     def on_thinking_chunk(self, text: str) -> None:
         """Handle an incoming thinking chunk."""
         self._thinking_buf.append(text)
@@ -272,38 +387,46 @@ class StreamManager:
 
     async def _drain_chunks(self, text: str) -> None:
         """Process all accumulated chunks in the buffer at once."""
-        if not self._current_detector:
+        detector = self._current_detector
+        if detector is None:
             return
-        self._current_detector.start()
+        block_count = len(detector.all_blocks)
+        detector.start()
         try:
             with self._batch_update():
-                await self._current_detector.feed(text)
-            self._schedule_scroll()
+                appended = await detector.feed(text)
         except Exception:
             logger.exception("Error processing chunk buffer")
+            return
+        # Scroll for new text or for a freshly mounted (still empty) block
+        if appended or len(detector.all_blocks) != block_count:
+            self._schedule_scroll()
 
     async def _drain_thinking(self, text: str) -> None:
         """Process all accumulated thinking chunks in the buffer at once."""
+        block = self._thinking_block
+        if block is None:
+            block = self._thinking_block = ThinkingOutputBlock(activity=True)
+            self._output.append_block(block, scroll=False)
         try:
-            if self._thinking_block is None:
-                self._thinking_block = ThinkingOutputBlock(activity=True)
-                self._output.append_block(self._thinking_block, scroll=False)
             with self._batch_update():
-                await self._thinking_block.append(text)
-                self._thinking_block.flush()
-            self._schedule_scroll()
+                await block.append(text)
+                block.flush()
         except Exception:
             logger.exception("Error processing thinking buffer")
+            return
+        self._schedule_scroll()
 
     async def finalize(self) -> None:
         """Flush buffers and finalize thinking block and detector after streaming ends."""
-        self._thinking_buf.flush_sync()
+        # Awaited so buffered text reaches the blocks before they are finalized
+        await self._thinking_buf.flush_async()
         if self._thinking_block:
             self._thinking_block.finalize_streaming()
             self._thinking_block.mark_success()
             self._thinking_block = None
 
-        self._chunk_buf.flush_sync()
+        await self._chunk_buf.flush_async()
         if self._current_detector:
             await self._current_detector.finish()
 
@@ -134,14 +134,13 @@ def fuzzy_match_files(
         rel_path = str(path.relative_to(root))
         rel_lower = rel_path.lower()
 
-        qi = 0
-        for ch in rel_lower:
-            if qi < len(query) and ch == query[qi]:
-                qi += 1
-
-        if qi == len(query):
-            return len(rel_path)
-        return None
+        # Jump to each query char with str.find instead of walking every path char
+        pos = 0
+        for ch in query:
+            pos = rel_lower.find(ch, pos) + 1
+            if not pos:
+                return None
+        return len(rel_path)
 
     scored: list[tuple[int, Path]] = []
     for f in files:
@@ -2,8 +2,10 @@
 
 from __future__ import annotations
 
+import asyncio
 import json
 import logging
+import threading
 from pathlib import Path
 
 logger = logging.getLogger(__name__)
@@ -35,6 +37,10 @@ class History:
             self._history_file = Path(history_file)
 
         self._max_history_size = max_history_size
+        # Serializes background writes; stale snapshots are skipped
+        self._write_lock = threading.Lock()
+        self._snapshot_seq = 0
+        self._written_seq = 0
         self.load()
 
     def add(self, entry: str, mode: str) -> None:
@@ -182,19 +188,47 @@ class History:
 
     def save(self) -> None:
         """Save command history to disk."""
-        try:
-            self._history_file.parent.mkdir(parents=True, exist_ok=True)
+        self._write(*self._snapshot())
 
-            history_to_save = {
-                mode: self._histories[mode][-self._max_history_size :]
-                for mode in self.MODES
-            }
+    def save_async(self) -> asyncio.Future[None]:
+        """Save command history to disk without blocking the event loop.
 
-            with open(self._history_file, "w", encoding="utf-8") as f:
-                json.dump(history_to_save, f, indent=2)
+        The entries are snapshotted when this is called and the file write
+        runs in the default executor. Must be called from the event loop.
+        When saves overlap, an older snapshot never overwrites a newer one.
 
-            self._history_file.chmod(0o600)
-        except OSError as e:
-            logger.warning("Failed to save history to %s: %s", self._history_file, e)
-        except Exception as e:
-            logger.warning("Unexpected error saving history: %s", e)
+        Returns:
+            A future that completes once the write has finished.
+        """
+        snapshot = self._snapshot()
+        loop = asyncio.get_running_loop()
+        return loop.run_in_executor(None, self._write, *snapshot)
+
+    def _snapshot(self) -> tuple[int, dict[str, list[str]]]:
+        """Copy the entries to save, tagged with a sequence number."""
+        self._snapshot_seq += 1
+        history_to_save = {
+            mode: self._histories[mode][-self._max_history_size :]
+            for mode in self.MODES
+        }
+        return self._snapshot_seq, history_to_save
+
+    def _write(self, seq: int, history_to_save: dict[str, list[str]]) -> None:
+        """Write a snapshot to disk unless a newer one was already written."""
+        with self._write_lock:
+            if seq < self._written_seq:
+                return
+            self._written_seq = seq
+            try:
+                self._history_file.parent.mkdir(parents=True, exist_ok=True)
+
+                with open(self._history_file, "w", encoding="utf-8") as f:
+                    json.dump(history_to_save, f, indent=2)
+
+                self._history_file.chmod(0o600)
+            except OSError as e:
+                logger.warning(
+                    "Failed to save history to %s: %s", self._history_file, e
+                )
+            except Exception as e:
+                logger.warning("Unexpected error saving history: %s", e)
@@ -45,10 +45,11 @@ def load_prompt(name: str) -> tuple[Path, str] | None:
 
 def fuzzy_match(query: str, name: str) -> bool:
     """Simple fuzzy match: all query chars appear in order in name."""
-    query = query.lower()
     name = name.lower()
-    qi = 0
-    for ch in name:
-        if qi < len(query) and ch == query[qi]:
-            qi += 1
-    return qi == len(query)
+    # Jump to each query char with str.find instead of walking every name char
+    pos = 0
+    for ch in query.lower():
+        pos = name.find(ch, pos) + 1
+        if not pos:
+            return False
+    return True
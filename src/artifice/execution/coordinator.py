@@ -57,10 +57,12 @@ class ExecutionCoordinator:
         if config.shell_init_script and isinstance(self._shell_executor, ShellExecutor):
             self._shell_executor.init_script = config.shell_init_script
 
-        # Markdown settings
-        self.python_markdown_enabled: bool = config.python_markdown
-        self.agent_markdown_enabled: bool = config.agent_markdown
-        self.shell_markdown_enabled: bool = config.shell_markdown
+        # Markdown settings, keyed by input mode name
+        self.markdown_enabled: dict[str, bool] = {
+            "ai": config.agent_markdown,
+            "shell": config.shell_markdown,
+            "python": config.python_markdown,
+        }
 
     def reset(self) -> None:
         """Reset the Python executor state."""
@@ -76,14 +78,14 @@ class ExecutionCoordinator:
             Tuple of (markdown_enabled, use_code_block)
         """
         if language == "bash":
-            markdown_enabled = self.shell_markdown_enabled
+            markdown_enabled = self.markdown_enabled["shell"]
             use_code_block = (
                 self._config.tmux_output_code_block
                 if isinstance(self._shell_executor, TmuxShellExecutor)
                 else self._config.shell_output_code_block
             )
         else:
-            markdown_enabled = self.python_markdown_enabled
+            markdown_enabled = self.markdown_enabled["python"]
             use_code_block = self._config.python_output_code_block
         return markdown_enabled, use_code_block
 
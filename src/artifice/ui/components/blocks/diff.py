@@ -12,39 +12,39 @@ from textual.widgets import Static
 
 from artifice.ui.components.blocks.base import BaseBlock
 
+_LANGUAGE_BY_EXTENSION = {
+    ".py": "python",
+    ".js": "javascript",
+    ".ts": "typescript",
+    ".tsx": "typescript",
+    ".jsx": "javascript",
+    ".sh": "bash",
+    ".bash": "bash",
+    ".zsh": "bash",
+    ".json": "json",
+    ".yaml": "yaml",
+    ".yml": "yaml",
+    ".toml": "toml",
+    ".md": "markdown",
+    ".html": "html",
+    ".css": "css",
+    ".rs": "rust",
+    ".go": "go",
+    ".java": "java",
+    ".c": "c",
+    ".cpp": "cpp",
+    ".h": "c",
+    ".hpp": "cpp",
+    ".rb": "ruby",
+    ".php": "php",
+    ".sql": "sql",
+    ".xml": "xml",
+}
+
 
 def _detect_language(path: str) -> str:
     """Detect syntax highlighting language from file extension."""
-    ext = Path(path).suffix.lower()
-    lang_map = {
-        ".py": "python",
-        ".js": "javascript",
-        ".ts": "typescript",
-        ".tsx": "typescript",
-        ".jsx": "javascript",
-        ".sh": "bash",
-        ".bash": "bash",
-        ".zsh": "bash",
-        ".json": "json",
-        ".yaml": "yaml",
-        ".yml": "yaml",
-        ".toml": "toml",
-        ".md": "markdown",
-        ".html": "html",
-        ".css": "css",
-        ".rs": "rust",
-        ".go": "go",
-        ".java": "java",
-        ".c": "c",
-        ".cpp": "cpp",
-        ".h": "c",
-        ".hpp": "cpp",
-        ".rb": "ruby",
-        ".php": "php",
-        ".sql": "sql",
-        ".xml": "xml",
-    }
-    return lang_map.get(ext, "text")
+    return _LANGUAGE_BY_EXTENSION.get(Path(path).suffix.lower(), "text")
 
 
 class DiffLine(Static):
@@ -11,9 +11,15 @@ class StatusMixin:
     """Mixin for blocks that display execution status via an icon."""
 
     _status_icon: Static
+    _shown_status: ExecutionStatus | None = None
 
     def update_status_icon(self, status: ExecutionStatus) -> None:
-        """Update the status indicator based on execution result."""
+        """Update the status indicator based on execution result.
+
+        Does nothing if the icon already shows this status.
+        """
+        if status == self._shown_status:
+            return
         if status == ExecutionStatus.SUCCESS:
             self._status_icon.update("\u2714")
             self._status_icon.remove_class("status-error")
@@ -22,9 +28,13 @@ class StatusMixin:
             self._status_icon.update("\u2716")
             self._status_icon.remove_class("status-success")
             self._status_icon.add_class("status-error")
+        else:
+            return
+        self._shown_status = status
 
     def clear_status_icon(self) -> None:
         """Clear status styling and reset icon."""
         self._status_icon.remove_class("status-success")
         self._status_icon.remove_class("status-error")
         self._status_icon.update("")
+        self._shown_status = None
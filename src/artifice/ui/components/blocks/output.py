@@ -2,8 +2,6 @@
 
 from __future__ import annotations
 
-import asyncio
-
 from textual.app import ComposeResult
 from textual.containers import Horizontal
 from textual.widgets import Static, Markdown
@@ -24,7 +22,7 @@ class StreamingMarkdownBlock(BaseBlock):
         self._streaming = activity
         self._markdown_widget: Markdown | None = None
         self._markdown_stream = None
-        self._accumulated_text: str = initial_text
+        self._pending_text: list[str] = [initial_text] if initial_text else []
         self._stream_ready: bool = False
         self.add_class("in-context")
 
@@ -34,30 +32,32 @@ class StreamingMarkdownBlock(BaseBlock):
     def compose(self) -> ComposeResult:
         with Horizontal():
             yield self._status_indicator
-            if self._accumulated_text:
-                self._markdown_widget = Markdown(self._accumulated_text)
-            else:
-                self._markdown_widget = Markdown("")
+            self._markdown_widget = Markdown("")
             yield self._markdown_widget
 
-    def on_mount(self) -> None:
+    async def on_mount(self) -> None:
         """Get the markdown stream once the widget is mounted."""
         if self._markdown_widget is not None:
             self._markdown_stream = self._markdown_widget.get_stream(
                 self._markdown_widget
             )
             self._stream_ready = True
-            if self._accumulated_text:
-                asyncio.create_task(self._markdown_stream.write(self._accumulated_text))
+            if self._pending_text:
+                text = "".join(self._pending_text)
+                self._pending_text.clear()
+                # Awaited rather than spawned so it is queued ahead of later appends
+                await self._markdown_stream.write(text)
 
     async def append(self, text: str) -> None:
         """Append text to the streaming markdown.
 
-        Accumulates text and writes to the markdown stream when ready.
+        Text is held until the stream is ready; after that only the new text
+        is written to the stream.
         """
-        self._accumulated_text += text
         if self._stream_ready and self._markdown_stream is not None:
             await self._markdown_stream.write(text)
+        else:
+            self._pending_text.append(text)
 
     def flush(self) -> None:
         """No-op for streaming markdown - updates happen immediately via append."""
@@ -106,6 +106,7 @@ class BufferedOutputBlock(BaseBlock):
     def __init__(self, output: str = "", render_markdown: bool = False) -> None:
         super().__init__()
         self._output_str: str = output
+        self._pending_output: list[str] = []
         self._render_markdown = render_markdown
         self._dirty = False
         self._contents = Horizontal()
@@ -113,13 +114,21 @@ class BufferedOutputBlock(BaseBlock):
         self._markdown = Markdown("", classes=self._MARKDOWN_CSS_CLASS)
         self._markdown_loaded = False
 
+    def _collect_output(self) -> str:
+        """Fold pending appends into the output string and return it."""
+        if self._pending_output:
+            self._pending_output.insert(0, self._output_str)
+            self._output_str = "".join(self._pending_output)
+            self._pending_output.clear()
+        return self._output_str
+
     def flush(self) -> None:
         """Push accumulated text to the widget. Call after batching appends."""
         if not self._dirty:
             return
         self._dirty = False
         if self._output:
-            self._output.update(self._output_str)
+            self._output.update(self._collect_output())
 
     def toggle_markdown(self) -> None:
         """Toggle between static and markdown rendering."""
@@ -127,7 +136,7 @@ class BufferedOutputBlock(BaseBlock):
         if self._render_markdown:
             if not self._markdown_loaded:
                 self._markdown_loaded = True
-                self._markdown.update(self._output_str.strip())
+                self._markdown.update(self._collect_output().strip())
             self._output.styles.display = "none"
             self._markdown.styles.display = "block"
         else:
@@ -138,7 +147,7 @@ class BufferedOutputBlock(BaseBlock):
         """Switch to markdown display - both widgets pre-mounted, just toggle display."""
         if not self._markdown_loaded:
             self._markdown_loaded = True
-            self._markdown.update(self._output_str.strip())
+            self._markdown.update(self._collect_output().strip())
         self._output.styles.display = "none"
         self._markdown.styles.display = "block"
 
@@ -169,8 +178,8 @@ class CodeOutputBlock(BufferedOutputBlock):
         self._markdown.styles.display = "none"
 
     def append_output(self, output: str) -> None:
-        """Append output text to the buffer."""
-        self._output_str += output
+        """Append output text to the buffer; it is joined on the next flush."""
+        self._pending_output.append(output)
         self._dirty = True
 
     def append_error(self, output: str) -> None:
@@ -267,6 +267,7 @@ class TerminalInput(Static):
         self.mode = InputMode.AI
         self._history = history
         self._search_manager: SearchModeManager | None = None
+        self._text_area: InputTextArea | None = None
         self.add_class("in-context")
 
     def compose(self) -> ComposeResult:
@@ -274,11 +275,19 @@ class TerminalInput(Static):
             with Vertical(classes="prompt-container"):
                 yield LoadingIndicator(id="activity-indicator")
                 yield Static("]", classes="prompt", id="prompt-display")
-            yield InputTextArea(id="code-input")
+            self._text_area = InputTextArea(id="code-input")
+            yield self._text_area
+
+    @property
+    def text_area(self) -> InputTextArea:
+        """The input text area, cached from compose."""
+        if self._text_area is None:
+            self._text_area = self.query_one("#code-input", InputTextArea)
+        return self._text_area
 
     def on_mount(self) -> None:
         """Focus the text area on mount."""
-        text_area = self.query_one("#code-input", InputTextArea)
+        text_area = self.text_area
         text_area.focus()
         # Hide the loading indicator initially
         self.query_one("#activity-indicator", LoadingIndicator).styles.display = "none"
@@ -320,7 +329,7 @@ class TerminalInput(Static):
     def update_prompt(self) -> None:
         """Update the prompt display based on current mode."""
         prompt_widget = self.query_one("#prompt-display", Static)
-        text_area = self.query_one("#code-input", InputTextArea)
+        text_area = self.text_area
 
         with self.app.batch_update():
             prompt_widget.update(self.mode.prompt_char)
@@ -329,12 +338,12 @@ class TerminalInput(Static):
     @property
     def code(self) -> str:
         """Get the current code in the input."""
-        return self.query_one("#code-input", TextArea).text
+        return self.text_area.text
 
     @code.setter
     def code(self, value: str) -> None:
         """Set the code in the input."""
-        self.query_one("#code-input", TextArea).text = value
+        self.text_area.text = value
 
     def clear(self) -> None:
         """Clear the input."""
@@ -347,7 +356,8 @@ class TerminalInput(Static):
             # Add to history before submitting
             if self._history is not None:
                 self._history.add(code, self.mode.value.name)
-                self._history.save()
+                # Written in the background so large histories don't stall input
+                self._history.save_async()
 
             # Check for slash command in AI mode
             if self.mode.is_ai and code.startswith("/"):
@@ -562,4 +572,4 @@ class TerminalInput(Static):
     def focus_input(self) -> None:
         """Focus the input text area."""
         if not self._search_manager or not self._search_manager.active:
-            self.query_one("#code-input", InputTextArea).focus()
+            self.text_area.focus()
@@ -117,8 +117,21 @@ class TerminalOutput(HighlightableContainerMixin, VerticalScroll):
         Binding("ctrl+o", "toggle_block_markdown", "Toggle Markdown", show=True),
     ]
 
+    def __init__(self, **kwargs) -> None:
+        super().__init__(**kwargs)
+        # id(block) -> position in _blocks, for O(1) index_of
+        self._block_indices: dict[int, int] = {}
+        self._input_area: InputTextArea | None = None
+
+    def _focus_input(self) -> None:
+        """Move focus back to the input text area, looked up once and cached."""
+        if self._input_area is None:
+            self._input_area = self.app.query_one("#code-input", InputTextArea)
+        self._input_area.focus()
+
     def append_block(self, block: BaseBlock, scroll: bool = True):
         """Append a block to the output and optionally scroll to end."""
+        self._block_indices[id(block)] = len(self._blocks)
         self._blocks.append(block)
         self.mount(block)
         if scroll:
@@ -127,16 +140,13 @@ class TerminalOutput(HighlightableContainerMixin, VerticalScroll):
 
     def index_of(self, block: BaseBlock) -> int | None:
         """Return the index of a block, or None if not found."""
-        try:
-            return self._blocks.index(block)
-        except ValueError:
-            return None
+        return self._block_indices.get(id(block))
 
     def clear(self) -> None:
-        """Clear all output."""
-        for block in self._blocks:
-            block.remove()
+        """Clear all output in a single DOM removal."""
+        self.remove_children()
         self._blocks.clear()
+        self._block_indices.clear()
         self._highlighted_index = None
 
     def action_activate_block(self) -> None:
@@ -179,7 +189,7 @@ class TerminalOutput(HighlightableContainerMixin, VerticalScroll):
     def action_highlight_next(self) -> None:
         """Move highlight to next output block."""
         if not self.highlight_next():
-            self.app.query_one("#code-input", InputTextArea).focus()
+            self._focus_input()
 
     def action_highlight_previous_code(self) -> None:
         """Move highlight to the previous CodeInputBlock, skipping other block types."""
@@ -211,7 +221,7 @@ class TerminalOutput(HighlightableContainerMixin, VerticalScroll):
                 self._update_highlight(previous_index)
                 return
         # No more code blocks forward -- move focus to input
-        self.app.query_one("#code-input", InputTextArea).focus()
+        self._focus_input()
 
     def on_focus(self) -> None:
         """When focusing on TerminalOutput, highlight the last CodeInputBlock."""
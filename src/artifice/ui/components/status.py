@@ -25,6 +25,7 @@ class StatusIndicatorManager:
         self._connection = connection_status
         self._agent = agent_status
         self._config = config
+        self._shown_status: str | None = None
 
     def set_active(self) -> None:
         """Update status indicators to show agent is processing."""
@@ -60,6 +61,12 @@ class StatusIndicatorManager:
                             f"  [{format_tokens(usage.input_tokens)}in / "
                             f"{format_tokens(usage.output_tokens)}out]"
                         )
-                self._agent.update(status)
+                self._set_agent_status(status)
                 return
-        self._agent.update("")
+        self._set_agent_status("")
+
+    def _set_agent_status(self, status: str) -> None:
+        """Update the agent status line, skipping the re-render if unchanged."""
+        if status != self._shown_status:
+            self._shown_status = status
+            self._agent.update(status)
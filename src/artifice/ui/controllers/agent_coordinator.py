@@ -58,6 +58,11 @@ class AgentCoordinator:
         self._terminal = terminal
         self._status_manager = status_manager
         self._current_task: asyncio.Task | None = None
+        # Execution results waiting for the in-flight send to finish, the task
+        # sending them, and a future completed once the queued batch is answered
+        self._pending_results: list[str] = []
+        self._results_sender: asyncio.Task | None = None
+        self._next_batch_done: asyncio.Future[None] | None = None
 
     async def handle_agent_prompt(self, prompt: str) -> None:
         """Handle AI agent prompt with code block detection.
@@ -84,6 +89,11 @@ class AgentCoordinator:
     ) -> None:
         """Send execution results back to the agent and get its response.
 
+        If a previous result is still being sent, this one is queued and the
+        in-flight call sends all queued results together in a single prompt
+        once the agent's current response completes. Queued callers wait for
+        that batch, so they stay cancellable until the agent has answered.
+
         Args:
             code: The code that was executed
             language: The programming language (python or bash)
@@ -93,15 +103,60 @@ class AgentCoordinator:
         if self._agent is None:
             return
 
-        result_text = output + error
         prompt = (
-            f"Executed: <{language}>{code}</{language}>"
-            + "\n\nOutput:\n"
-            + result_text
-            + "\n"
+            f"Executed: <{language}>{code}</{language}>\n\nOutput:\n{output}{error}\n"
         )
-        detector, response = await self._stream_agent_response(self._agent, prompt)
-        await self._apply_agent_response(detector, response)
+        self._pending_results.append(prompt)
+        if self._results_sender is not None:
+            await self._wait_for_queued_result()
+            return
+
+        self._results_sender = asyncio.current_task()
+        batch_done: asyncio.Future[None] | None = None
+        try:
+            while self._pending_results:
+                prompt = "\n".join(self._pending_results)
+                self._pending_results.clear()
+                batch_done, self._next_batch_done = self._next_batch_done, None
+                detector, response = await self._stream_agent_response(
+                    self._agent, prompt
+                )
+                await self._apply_agent_response(detector, response)
+                if batch_done is not None:
+                    batch_done.set_result(None)
+            # Results dropped by clear() leave nothing to send; release waiters
+            if self._next_batch_done is not None:
+                self._next_batch_done.set_result(None)
+                self._next_batch_done = None
+        except BaseException as e:
+            # Queued results die with the batch instead of riding on a later send
+            self._pending_results.clear()
+            for future in (batch_done, self._next_batch_done):
+                if future is not None and not future.done():
+                    if isinstance(e, asyncio.CancelledError):
+                        future.cancel()
+                    else:
+                        future.set_exception(e)
+            self._next_batch_done = None
+            raise
+        finally:
+            self._results_sender = None
+
+    async def _wait_for_queued_result(self) -> None:
+        """Wait until the in-flight sender has delivered the queued result.
+
+        Cancelling the waiter (e.g. via Escape on the queued command) cancels
+        the sender too, since it is streaming the response on our behalf.
+        """
+        if self._next_batch_done is None:
+            self._next_batch_done = asyncio.get_running_loop().create_future()
+        batch_done = self._next_batch_done
+        try:
+            await asyncio.shield(batch_done)
+        except asyncio.CancelledError:
+            if not batch_done.done() and self._results_sender is not None:
+                self._results_sender.cancel()
+            raise
 
     async def _stream_agent_response(
         self, agent: AnyAgent, prompt: str
@@ -120,12 +175,6 @@ class AgentCoordinator:
         # Instead, detector.start() is called lazily in _drain_chunks (via
         # call_later) so block ordering matches the arrival order of content.
 
-        def on_chunk(text):
-            self._stream.on_chunk(text)
-
-        def on_thinking_chunk(text):
-            self._stream.on_thinking_chunk(text)
-
         # Apply prompt prefix if configured
         prompt_prefix = self._terminal.get_config_value("prompt_prefix")
         if prompt_prefix and prompt.strip():
@@ -134,7 +183,9 @@ class AgentCoordinator:
         self._status_manager.set_active()
         try:
             response = await agent.send(
-                prompt, on_chunk=on_chunk, on_thinking_chunk=on_thinking_chunk
+                prompt,
+                on_chunk=self._stream.on_chunk,
+                on_thinking_chunk=self._stream.on_thinking_chunk,
             )
         except asyncio.CancelledError:
             self._status_manager.set_inactive()
@@ -167,7 +218,8 @@ class AgentCoordinator:
                         language=tc.display_language,
                         tool_args=tc.args,
                     )
-                    self._output.append_block(tool_block)
+                    # The scroll scheduled after finalization covers these blocks
+                    self._output.append_block(tool_block, scroll=False)
                     self._terminal.mark_block_in_context(tool_block)
                     if first_tool_block is None:
                         first_tool_block = tool_block
@@ -212,6 +264,7 @@ class AgentCoordinator:
 
     def clear(self) -> None:
         """Clear the agent's conversation context."""
+        self._pending_results.clear()
         if self._agent is not None:
             self._agent.clear()
 
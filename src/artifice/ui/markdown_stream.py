@@ -2,7 +2,6 @@
 
 from __future__ import annotations
 
-import asyncio
 import logging
 from typing import TYPE_CHECKING
 
@@ -11,6 +10,7 @@ from textual.events import Key
 from textual.widgets import Markdown, Static
 
 from artifice.agent.runner import run_agent_loop
+from artifice.agent.streaming import ChunkBuffer
 from artifice.utils.theme import create_artifice_theme
 
 if TYPE_CHECKING:
@@ -54,6 +54,7 @@ class MarkdownStreamApp(App):
         self._tool_output = tool_output
         self._markdown: Markdown | None = None
         self._stream = None
+        self._chunks = ChunkBuffer(self.call_later, self._drain_chunks)
         self._final_text = ""
         self._streaming_done = False
 
@@ -77,27 +78,28 @@ class MarkdownStreamApp(App):
         if self._streaming_done and event.key in ("enter", "escape"):
             self.exit()
 
-    async def _run_prompt(self) -> None:
-        def on_chunk(chunk: str) -> None:
-            if self._stream is not None:
-                asyncio.create_task(self._stream.write(chunk))
-            self.screen.scroll_end(animate=False)
+    def _write_chunk(self, text: str) -> None:
+        """Buffer streamed response and tool-call text for the markdown."""
+        self._chunks.append(text)
 
-        def on_tool_call(text: str) -> None:
-            if self._stream is not None:
-                asyncio.create_task(self._stream.write(text))
-            self.screen.scroll_end(animate=False)
+    async def _drain_chunks(self, text: str) -> None:
+        """Write a frame's worth of buffered text to the markdown and scroll once."""
+        if self._stream is not None:
+            await self._stream.write(text)
+        self.screen.scroll_end(animate=False)
 
+    async def _run_prompt(self) -> None:
         final_text, _ = await run_agent_loop(
             self._agent,
             self._prompt,
-            on_chunk,
+            self._write_chunk,
             self._tool_approval,
             self._tool_allowlist,
             self._tool_output,
-            on_tool_call,
+            self._write_chunk,
         )
         self._final_text = final_text
+        self._chunks.flush_sync()
 
         self._streaming_done = True
         self.query_one("#exit-hint", Static).update("Press Enter or Escape to exit")
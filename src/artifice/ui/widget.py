@@ -29,7 +29,7 @@ from artifice.agent import (
 from artifice.agent.streaming import StreamManager
 from artifice.execution import ExecutionResult, ExecutionStatus
 from artifice.execution.coordinator import ExecutionCoordinator
-from artifice.ui.components.input import TerminalInput, InputTextArea
+from artifice.ui.components.input import TerminalInput
 from artifice.ui.components.output import TerminalOutput
 from artifice.ui.components.blocks.blocks import (
     AgentInputBlock,
@@ -43,6 +43,8 @@ from artifice.ui.components.status import StatusIndicatorManager
 from artifice.ui.controllers import AgentCoordinator, NavigationController
 
 if TYPE_CHECKING:
+    from collections.abc import Callable
+
     from artifice.tui import ArtificeApp
     from typing import Union
 
@@ -51,6 +53,16 @@ if TYPE_CHECKING:
 logger = logging.getLogger(__name__)
 
 
+class _BlockExecutionState:
+    """Mutable state shared between a block execution task and its cleanup."""
+
+    __slots__ = ("result", "sent_to_agent")
+
+    def __init__(self, result: ExecutionResult | None = None) -> None:
+        self.result = result
+        self.sent_to_agent = False
+
+
 class ArtificeTerminal(Widget):
     """Primary widget for interacting with Artifice."""
 
@@ -69,10 +81,10 @@ class ArtificeTerminal(Widget):
         Binding("pagedown", "scroll_output_down", "Page Down", show=False),
     ]
 
-    _MARKDOWN_SETTINGS = {
-        "ai": ("agent_markdown_enabled", "AI agent output"),
-        "shell": ("shell_markdown_enabled", "shell command output"),
-        "python": ("python_markdown_enabled", "Python code output"),
+    _MARKDOWN_LABELS = {
+        "ai": "AI agent output",
+        "shell": "shell command output",
+        "python": "Python code output",
     }
 
     def __init__(
@@ -109,7 +121,14 @@ class ArtificeTerminal(Widget):
         self.agent_status = Static("", id="agent-status")
 
         # Context tracking
-        self._context_blocks: list[BaseBlock] = []
+        self._context_blocks: set[BaseBlock] = set()
+
+        # Built-in slash commands; anything else is looked up as a prompt
+        self._slash_commands: dict[str, Callable[[], None]] = {
+            "/clear": self.action_clear_agent_context,
+            "/exit": lambda: self.app.exit(),
+            "/help": self._show_slash_help,
+        }
 
         # Execution coordinator (injected or created)
         if execution_coordinator is not None:
@@ -190,10 +209,7 @@ class ArtificeTerminal(Widget):
     def set_auto_send_enabled(self, value: bool) -> None:
         """Set auto-send to agent mode."""
         self._send_user_commands_to_agent = value
-        if value:
-            self.input.add_class("in-context")
-        else:
-            self.input.remove_class("in-context")
+        self.input.set_class(value, "in-context")
 
     def is_auto_send_enabled(self) -> bool:
         """Check if auto-send to agent mode is enabled."""
@@ -205,7 +221,7 @@ class ArtificeTerminal(Widget):
 
     def focus_input(self) -> None:
         """Focus the input text area."""
-        self.input.query_one("#code-input", InputTextArea).focus()
+        self.input.text_area.focus()
 
     def compose(self) -> ComposeResult:
         with Vertical():
@@ -322,7 +338,7 @@ class ArtificeTerminal(Widget):
     def mark_block_in_context(self, block: BaseBlock) -> None:
         """Mark a block as being in the agent's context."""
         if block not in self._context_blocks:
-            self._context_blocks.append(block)
+            self._context_blocks.add(block)
             block.add_class("in-context")
 
     def _clear_all_context_highlights(self) -> None:
@@ -353,7 +369,7 @@ class ArtificeTerminal(Widget):
             self.input.update_prompt()
         except ValueError:
             pass
-        self.input.query_one("#code-input", InputTextArea).focus()
+        self.input.text_area.focus()
 
     async def on_terminal_output_block_execute_requested(
         self, event: TerminalOutput.BlockExecuteRequested
@@ -373,25 +389,24 @@ class ArtificeTerminal(Widget):
         language = "bash" if mode == "shell" else "python"
 
         block.show_loading()
-        self.input.query_one("#code-input", InputTextArea).focus()
+        self.input.text_area.focus()
 
         tool_call_id = block.tool_call_id if isinstance(block, ToolCallBlock) else None
-        state = {
-            "result": ExecutionResult(code=code, status=ExecutionStatus.ERROR),
-            "sent_to_agent": False,
-        }
+        state = _BlockExecutionState(
+            ExecutionResult(code=code, status=ExecutionStatus.ERROR)
+        )
 
         async def do_execute():
-            state["result"] = await self._exec.execute(
+            state.result = await self._exec.execute(
                 code,
                 language=language,
                 code_input_block=block,
                 in_context=self._send_user_commands_to_agent,
             )
-            block.update_status(state["result"])
+            block.update_status(state.result)
             if self._send_user_commands_to_agent and self._agent is not None:
-                state["sent_to_agent"] = True
-                output = state["result"].output + state["result"].error
+                state.sent_to_agent = True
+                output = state.result.output + state.result.error
                 if tool_call_id is not None:
                     # Structured tool result — agent knows which call this answers
                     self._agent_coord.add_tool_result(tool_call_id, output)
@@ -399,14 +414,14 @@ class ArtificeTerminal(Widget):
                         await self._agent_coord.continue_after_tool_call()
                 else:
                     await self._send_execution_result_to_agent(
-                        code, language, state["result"]
+                        code, language, state.result
                     )
 
         def cleanup():
-            if state["result"]:
-                block.update_status(state["result"])
+            if state.result:
+                block.update_status(state.result)
             block.finish_streaming()
-            if not state["sent_to_agent"]:
+            if not state.sent_to_agent:
                 self.input.focus_input()
 
         self._current_task = asyncio.create_task(
@@ -418,9 +433,9 @@ class ArtificeTerminal(Widget):
         import json
 
         block.show_loading()
-        self.input.query_one("#code-input", InputTextArea).focus()
+        self.input.text_area.focus()
 
-        state: dict = {"sent_to_agent": False}
+        state = _BlockExecutionState()
 
         async def do_execute():
             tc = ToolCall(
@@ -476,14 +491,14 @@ class ArtificeTerminal(Widget):
                 self.mark_block_in_context(output_block)
 
             if self._send_user_commands_to_agent and self._agent is not None:
-                state["sent_to_agent"] = True
+                state.sent_to_agent = True
                 self._agent_coord.add_tool_result(block.tool_call_id, result_text)
                 if not self._agent_coord.has_pending_tool_calls:
                     await self._agent_coord.continue_after_tool_call()
 
         def cleanup():
             block.finish_streaming()
-            if not state["sent_to_agent"]:
+            if not state.sent_to_agent:
                 self.input.focus_input()
 
         self._current_task = asyncio.create_task(
@@ -509,11 +524,12 @@ class ArtificeTerminal(Widget):
     async def action_toggle_mode_markdown(self) -> None:
         """Toggle markdown rendering for the current input mode."""
         mode_name = self.input.mode.value.name
-        attr, label = self._MARKDOWN_SETTINGS[mode_name]
-        current = getattr(self._exec, attr)
-        setattr(self._exec, attr, not current)
-        enabled_str = "enabled" if not current else "disabled"
-        self.app.notify(f"Markdown {enabled_str} for {label}")
+        enabled = not self._exec.markdown_enabled[mode_name]
+        self._exec.markdown_enabled[mode_name] = enabled
+        enabled_str = "enabled" if enabled else "disabled"
+        self.app.notify(
+            f"Markdown {enabled_str} for {self._MARKDOWN_LABELS[mode_name]}"
+        )
 
     def reset(self) -> None:
         """Reset the REPL state."""
@@ -532,14 +548,13 @@ class ArtificeTerminal(Widget):
     def action_toggle_send_user_commands_to_agent(self) -> None:
         """Toggle auto-send mode."""
         self._send_user_commands_to_agent = not self._send_user_commands_to_agent
+        self.input.set_class(self._send_user_commands_to_agent, "in-context")
 
         if self._send_user_commands_to_agent:
-            self.input.add_class("in-context")
             for block in self.output.children:
-                if isinstance(block, BaseBlock) and block not in self._context_blocks:
+                if isinstance(block, BaseBlock):
                     self.mark_block_in_context(block)
         else:
-            self.input.remove_class("in-context")
             self._clear_all_context_highlights()
 
     def on_terminal_input_prompt_selected(
@@ -556,16 +571,9 @@ class ArtificeTerminal(Widget):
         """Handle slash commands in AI mode."""
         command = event.command
 
-        if command == "/clear":
-            self.action_clear_agent_context()
-            return
-
-        if command == "/exit":
-            self.app.exit()
-            return
-
-        if command == "/help":
-            self._show_slash_help()
+        handler = self._slash_commands.get(command)
+        if handler is not None:
+            handler()
             return
 
         prompt_name = command[1:]
@@ -1,8 +1,17 @@
 """Tests for the Agent class."""
 
+import dataclasses
+
 import pytest
 
-from artifice.agent import SimulatedAgent, ToolCall, ToolDef, TOOLS, execute_tool_call
+from artifice.agent import (
+    Agent,
+    SimulatedAgent,
+    ToolCall,
+    ToolDef,
+    TOOLS,
+    execute_tool_call,
+)
 from artifice.agent.tools import get_all_schemas, get_schemas_for
 
 
@@ -183,6 +192,29 @@ def test_get_schemas_for_glob_pattern():
     assert names == {"python"}
 
 
+def test_agent_reuses_tool_schemas_until_tools_change():
+    """Agent builds tool schemas once and rebuilds only when tools change."""
+    agent = Agent(provider=None, tools=["read"])  # type: ignore[arg-type]
+    first = agent._get_tool_schemas()
+    assert first is agent._get_tool_schemas()
+
+    agent.tools = ["read", "glob"]
+    names = {s["function"]["name"] for s in agent._get_tool_schemas() or []}
+    assert names == {"read", "glob"}
+
+
+def test_agent_rebuilds_tool_schemas_when_tool_reregistered(monkeypatch):
+    """Replacing a registered tool in place invalidates the cached schemas."""
+    agent = Agent(provider=None, tools=["read"])  # type: ignore[arg-type]
+    agent._get_tool_schemas()
+
+    replaced = dataclasses.replace(TOOLS["read"], description="Updated read")
+    monkeypatch.setitem(TOOLS, "read", replaced)
+
+    schemas = agent._get_tool_schemas() or []
+    assert schemas[0]["function"]["description"] == "Updated read"
+
+
 def test_get_schemas_for_no_match():
     """Test that get_schemas_for returns empty list for no matches."""
     schemas = get_schemas_for(["nonexistent_*"])
@@ -0,0 +1,115 @@
+"""Tests for AgentCoordinator execution-result batching."""
+
+import asyncio
+from unittest.mock import MagicMock
+
+import pytest
+
+from artifice.ui.controllers.agent_coordinator import AgentCoordinator
+
+
+def _make_coordinator():
+    coord = AgentCoordinator(
+        agent=MagicMock(),
+        stream_manager=MagicMock(),
+        output=MagicMock(),
+        terminal=MagicMock(),
+        status_manager=MagicMock(),
+    )
+    prompts = []
+    release = asyncio.Event()
+
+    async def fake_stream(_agent, prompt):
+        prompts.append(prompt)
+        await release.wait()
+        return MagicMock(), MagicMock()
+
+    async def fake_apply(_detector, _response):
+        pass
+
+    coord._stream_agent_response = fake_stream
+    coord._apply_agent_response = fake_apply
+    return coord, prompts, release
+
+
+def _send(coord, code, language="bash"):
+    return asyncio.create_task(
+        coord.send_execution_result_to_agent(code, language, "out", "")
+    )
+
+
+@pytest.mark.asyncio
+async def test_results_queued_during_send_are_batched():
+    """Results arriving while a send is in flight go out together in one prompt."""
+    coord, prompts, release = _make_coordinator()
+
+    first = _send(coord, "a")
+    await asyncio.sleep(0)
+    second = _send(coord, "b")
+    third = _send(coord, "c", "python")
+    await asyncio.sleep(0)
+    assert len(prompts) == 1
+    # Queued callers wait until their batch has been answered
+    assert not second.done()
+    assert not third.done()
+
+    release.set()
+    await asyncio.gather(first, second, third)
+
+    assert len(prompts) == 2
+    assert "<bash>a</bash>" in prompts[0]
+    assert "<bash>b</bash>" in prompts[1]
+    assert "<python>c</python>" in prompts[1]
+
+
+@pytest.mark.asyncio
+async def test_cancelling_sender_drops_queued_results():
+    """Cancelling the in-flight send cancels queued callers and forgets their results."""
+    coord, prompts, release = _make_coordinator()
+
+    first = _send(coord, "a")
+    await asyncio.sleep(0)
+    queued = _send(coord, "b")
+    await asyncio.sleep(0)
+
+    first.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await first
+    with pytest.raises(asyncio.CancelledError):
+        await queued
+    assert coord._pending_results == []
+
+    release.set()
+    await _send(coord, "c")
+    assert "<bash>b</bash>" not in prompts[-1]
+    assert "<bash>c</bash>" in prompts[-1]
+
+
+@pytest.mark.asyncio
+async def test_cancelling_queued_caller_cancels_sender():
+    """Escape on a queued command stops the response streamed on its behalf."""
+    coord, _prompts, _release = _make_coordinator()
+
+    first = _send(coord, "a")
+    await asyncio.sleep(0)
+    queued = _send(coord, "b")
+    await asyncio.sleep(0)
+
+    queued.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await queued
+    with pytest.raises(asyncio.CancelledError):
+        await first
+    assert coord._pending_results == []
+
+
+@pytest.mark.asyncio
+async def test_single_result_sent_directly():
+    """A result with nothing in flight is sent immediately on its own."""
+    coord, prompts, release = _make_coordinator()
+    release.set()
+
+    await coord.send_execution_result_to_agent("a", "bash", "1", "")
+
+    assert len(prompts) == 1
+    assert coord._pending_results == []
@@ -1,5 +1,9 @@
 """Tests for the ChunkBuffer helper class."""
 
+import asyncio
+
+import pytest
+
 from artifice.agent.streaming import ChunkBuffer
 
 
@@ -39,23 +43,81 @@ class TestChunkBuffer:
         scheduled[0]()
         assert drained == ["abc"]
 
-    # Failing because there is no asyncio loop
-    #    def test_drain_resets_scheduling(self):
-    #        """After a drain, new appends schedule a new drain."""
-    #        scheduled = []
-    #        drained = []
-    #
-    #        buf = ChunkBuffer(
-    #            schedule=lambda fn: scheduled.append(fn), drain=lambda t: drained.append(t)
-    #        )
-    #        buf.append("first")
-    #        scheduled[0]()
-    #
-    #        buf.append("second")
-    #        assert len(scheduled) == 2
-    #
-    #        scheduled[1]()
-    #        assert drained == ["first", "second"]
+    def test_drain_resets_scheduling(self):
+        """After a drain, new appends schedule a new drain."""
+        scheduled = []
+        drained = []
+
+        buf = ChunkBuffer(
+            schedule=lambda fn: scheduled.append(fn), drain=lambda t: drained.append(t)
+        )
+        buf.append("first")
+        scheduled[0]()
+
+        buf.append("second")
+        assert len(scheduled) == 2
+
+        scheduled[1]()
+        assert drained == ["first", "second"]
+
+    @pytest.mark.asyncio
+    async def test_throttled_drain_uses_loop_timer(self):
+        """Within min_interval, the drain is timed on the loop, not rescheduled."""
+        scheduled = []
+        drained = []
+
+        buf = ChunkBuffer(
+            schedule=lambda fn: scheduled.append(fn),
+            drain=lambda t: drained.append(t),
+            min_interval=0.01,
+        )
+        buf.append("first")
+        scheduled[0]()
+
+        buf.append("second")
+        assert len(scheduled) == 1
+
+        await asyncio.sleep(0.02)
+        assert drained == ["first", "second"]
+
+    @pytest.mark.asyncio
+    async def test_flush_sync_cancels_pending_timer(self):
+        """flush_sync cancels a timer armed by a throttled append."""
+        scheduled = []
+        drained = []
+
+        buf = ChunkBuffer(
+            schedule=lambda fn: scheduled.append(fn),
+            drain=lambda t: drained.append(t),
+            min_interval=60.0,
+        )
+        buf.append("first")
+        scheduled[0]()
+        buf.append("second")  # throttled: arms a loop timer
+        timer = buf._timer
+        assert timer is not None
+
+        buf.flush_sync()
+
+        assert timer.cancelled()
+        assert buf._timer is None
+        assert drained == ["first", "second"]
+
+    @pytest.mark.asyncio
+    async def test_flush_async_awaits_async_drain(self):
+        """flush_async returns only after an async drain has processed the text."""
+        drained = []
+
+        async def drain(text):
+            await asyncio.sleep(0)
+            drained.append(text)
+
+        buf = ChunkBuffer(schedule=lambda fn: None, drain=drain)
+        buf.append("tail")
+        await buf.flush_async()
+
+        assert drained == ["tail"]
+        assert not buf.pending
 
     def test_flush_sync_drains_immediately(self):
         """flush_sync drains buffered text without waiting for schedule."""
@@ -87,3 +149,24 @@ class TestChunkBuffer:
 
         buf.flush_sync()
         assert not buf.pending
+
+    def test_ready_predicate_defers_scheduling(self):
+        """Text the consumer can't use yet is buffered without scheduling."""
+        scheduled = []
+        drained = []
+
+        buf = ChunkBuffer(
+            schedule=lambda fn: scheduled.append(fn),
+            drain=lambda t: drained.append(t),
+            ready=lambda t: "\n" in t,
+        )
+        buf.append("partial ")
+        buf.append("line")
+        assert scheduled == []
+        assert buf.pending
+
+        buf.append(" done\n")
+        assert len(scheduled) == 1
+
+        scheduled[0]()
+        assert drained == ["partial line done\n"]
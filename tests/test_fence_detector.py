@@ -6,10 +6,12 @@ that content splits on markdown headers.
 
 from __future__ import annotations
 
+import asyncio
+import contextlib
 from typing import TYPE_CHECKING, Any
 from unittest.mock import patch
 import pytest
-from artifice.agent.streaming import StreamingFenceDetector
+from artifice.agent.streaming import StreamingFenceDetector, StreamManager
 
 if TYPE_CHECKING:
     from typing import Protocol
@@ -224,6 +226,28 @@ class TestSingleBlockStreaming:
         assert block.success  # type: ignore
 
 
+class TestCanAdvance:
+    """Tests for the drain readiness hint."""
+
+    def test_any_text_before_start(self):
+        d, _ = make_detector()
+        assert d.can_advance("no newline")
+
+    def test_requires_newline_after_start(self):
+        d, _ = make_detector()
+        d.start()
+        assert not d.can_advance("no newline")
+        assert d.can_advance("line end\n")
+
+    @pytest.mark.asyncio
+    async def test_feed_reports_whether_text_was_appended(self):
+        d, _ = make_detector()
+        d.start()
+        assert not await d.feed("partial")
+        assert await d.feed(" line\n")
+        assert d.all_blocks[0].text == "partial line\n"  # type: ignore
+
+
 class TestHeaderSplitting:
     """Tests for header-based block splitting."""
 
@@ -424,3 +448,58 @@ class TestEdgeCases:
         assert len(d.all_blocks) == 2
         assert "Intro" in d.all_blocks[0].text  # type: ignore
         assert d.all_blocks[1].text.startswith("#")  # type: ignore
+
+
+def make_stream_manager() -> tuple[StreamManager, FakeOutput]:
+    """Create a StreamManager that schedules onto the running loop."""
+    loop = asyncio.get_running_loop()
+    output: FakeOutput = FakeOutput()
+    manager = StreamManager(
+        output,  # type: ignore[arg-type]
+        call_later=loop.call_soon,
+        call_after_refresh=loop.call_soon,
+        batch_update=contextlib.nullcontext,
+    )
+    return manager, output
+
+
+class TestStreamManager:
+    """End-to-end streaming through ChunkBuffer and the detector."""
+
+    async def _stream(self, chunks: list[str], pause: bool) -> list[str]:
+        manager, out = make_stream_manager()
+        manager.create_detector()
+        for chunk in chunks:
+            manager.on_chunk(chunk)
+            if pause:
+                await asyncio.sleep(0.02)
+        await manager.finalize()
+        return [block.text for block in out._blocks]
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("pause", [False, True])
+    async def test_final_line_without_newline_is_kept(self, pause):
+        """Text after the last newline reaches the block before it is finalized."""
+        texts = await self._stream(["Hel", "lo\n", "Wor", "ld"], pause)
+        assert texts == ["Hello\nWorld"]
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("pause", [False, True])
+    async def test_single_line_reply_is_kept(self, pause):
+        """A reply with no newline at all is written in full."""
+        texts = await self._stream(["Hel", "lo", " there"], pause)
+        assert texts == ["Hello there"]
+
+    @pytest.mark.asyncio
+    async def test_first_drain_scrolls_to_new_block(self):
+        """Mounting the first block schedules a scroll even without a newline."""
+        manager, out = make_stream_manager()
+        scrolls = []
+        out.scroll_end = lambda animate=True: scrolls.append(animate)  # type: ignore[method-assign]
+        manager.create_detector()
+
+        manager.on_chunk("Hel")
+        await asyncio.sleep(0.02)
+
+        assert len(out._blocks) == 1
+        assert scrolls
@@ -1,6 +1,9 @@
 """Tests for History - command history with multi-mode navigation and persistence."""
 
 import json
+
+import pytest
+
 from artifice.core.history import History
 
 
@@ -163,6 +166,28 @@ class TestPersistence:
         mode = tmp_history_file.stat().st_mode & 0o777
         assert mode == 0o600
 
+    @pytest.mark.asyncio
+    async def test_save_async_writes_snapshot(self, tmp_history_file):
+        h = History(history_file=tmp_history_file)
+        h.add("first", "python")
+        pending = h.save_async()
+        h.add("second", "python")  # added after the save was requested
+        await pending
+
+        data = json.loads(tmp_history_file.read_text())
+        assert data["python"] == ["first"]
+
+    def test_stale_snapshot_not_written(self, tmp_history_file):
+        h = History(history_file=tmp_history_file)
+        h.add("old", "python")
+        stale = h._snapshot()
+        h.add("new", "python")
+        h.save()
+        h._write(*stale)
+
+        h2 = History(history_file=tmp_history_file)
+        assert h2.get_history("python") == ["old", "new"]
+
 
 class TestClear:
     def test_clear_empties_all(self, tmp_history_file):
@@ -53,6 +53,16 @@ class TestSimulatedAgentPatternMatching:
         resp = await agent.send("test")
         assert resp.text == "first"
 
+    @pytest.mark.asyncio
+    async def test_directly_replaced_scenario_uses_new_pattern(self):
+        agent = SimulatedAgent(response_delay=0)
+        agent.configure_scenarios([{"pattern": r"old", "response": "stale"}])
+        await agent.send("old")
+
+        agent.scenarios[0] = {"pattern": r"new", "response": "fresh"}
+        resp = await agent.send("new")
+        assert resp.text == "fresh"
+
 
 class TestSimulatedAgentSequential:
     @pytest.mark.asyncio